@@ -1,6 +1,6 @@
 """Drift check implementation using PSI."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 import numpy as np
 import pandas as pd
@@ -118,7 +118,10 @@ class DriftCheck(BaseCheck):
         )
 
     def _calculate_psi(
-        self, baseline: pd.Series, current: pd.Series, n_bins: int = 10
+        self,
+        baseline: Union[pd.Series, np.ndarray],
+        current: Union[pd.Series, np.ndarray],
+        n_bins: int = 10,
     ) -> float:
         """
         Calculate Population Stability Index.
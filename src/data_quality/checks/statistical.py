@@ -8,6 +8,18 @@ import pandas as pd
 from data_quality.checks.base import BaseCheck
 from data_quality.utils.constants import CheckStatus
 
+# Supported measures mapped to their pandas aggregation names
+_AGG_FUNCS = {
+    "mean": "mean",
+    "median": "median",
+    "std": "std",
+    "min": "min",
+    "max": "max",
+    "count": "count",
+    "skew": "skew",
+    "kurtosis": "kurt",
+}
+
 
 class StatisticalCheck(BaseCheck):
     """
@@ -54,17 +66,17 @@ class StatisticalCheck(BaseCheck):
         measure_thresholds = config.get("thresholds", {})
         results = []
 
-        # Calculate all measures
-        stats = {
-            "mean": values.mean(),
-            "median": values.median(),
-            "std": values.std(),
-            "min": values.min(),
-            "max": values.max(),
-            "count": len(values),
-            "skew": values.skew() if len(values) > 2 else 0,
-            "kurtosis": values.kurtosis() if len(values) > 3 else 0,
-        }
+        # Calculate only the requested measures in a single agg call
+        requested = list(dict.fromkeys(m for m in measures if m in _AGG_FUNCS))
+        stats = (
+            dict(zip(requested, values.agg([_AGG_FUNCS[m] for m in requested])))
+            if requested
+            else {}
+        )
+        if "skew" in stats and len(values) <= 2:
+            stats["skew"] = 0
+        if "kurtosis" in stats and len(values) <= 3:
+            stats["kurtosis"] = 0
 
         dates = self._get_unique_dates()
         date = dates[-1] if dates else pd.Timestamp.now().strftime("%Y-%m-%d")
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import logging.handlers
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -34,6 +35,10 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry)
 
 
+# JSONFormatter keeps no per-record state, so every handler can share one
+_JSON_FORMATTER = JSONFormatter()
+
+
 class ContextAdapter(logging.LoggerAdapter):
     """Logger adapter that adds context to log messages."""
 
@@ -50,6 +55,7 @@ def setup_logging(
     log_format: str = "text",
     log_file: Optional[str] = None,
     correlation_id: Optional[str] = None,
+    buffer_capacity: Optional[int] = None,
 ) -> None:
     """
     Set up logging configuration for the framework.
@@ -59,11 +65,19 @@ def setup_logging(
         log_format: Format type ('text' or 'json')
         log_file: Optional file path for log output
         correlation_id: Optional correlation ID for tracking
+        buffer_capacity: Optional number of file records to buffer in memory;
+            the buffer is flushed when full or on WARNING and above.
+            File writes are unbuffered by default.
     """
     root_logger = logging.getLogger("data_quality")
     root_logger.setLevel(getattr(logging, level.upper()))
 
-    # Clear existing handlers
+    # Close and clear existing handlers (MemoryHandler leaves its target open)
+    for handler in root_logger.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
     root_logger.handlers.clear()
 
     # Create console handler
@@ -71,7 +85,7 @@ def setup_logging(
     console_handler.setLevel(getattr(logging, level.upper()))
 
     if log_format == "json":
-        console_handler.setFormatter(JSONFormatter())
+        console_handler.setFormatter(_JSON_FORMATTER)
     else:
         text_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -85,11 +99,12 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file)
+        # Defer opening the file until the first record is written
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)  # File gets all logs
 
         if log_format == "json":
-            file_handler.setFormatter(JSONFormatter())
+            file_handler.setFormatter(_JSON_FORMATTER)
         else:
             file_handler.setFormatter(
                 logging.Formatter(
@@ -97,7 +112,16 @@ def setup_logging(
                 )
             )
 
-        root_logger.addHandler(file_handler)
+        if buffer_capacity:
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=buffer_capacity,
+                flushLevel=logging.WARNING,
+                target=file_handler,
+            )
+            buffered_handler.setLevel(logging.DEBUG)
+            root_logger.addHandler(buffered_handler)
+        else:
+            root_logger.addHandler(file_handler)
 
     # Store correlation ID
     if correlation_id:
@@ -0,0 +1,14 @@
+"""Suite-wide pytest configuration."""
+
+import pandas as pd
+
+# Import the package and every check eagerly so collection, not the first test
+# in each xdist worker, absorbs the one-time import cost.
+import data_quality  # noqa: F401
+import data_quality.managers.check_manager  # noqa: F401
+
+# Shared frame and config fixtures, available to every test module
+pytest_plugins = ["tests.fixtures.test_fixtures"]
+
+# Touch the datetime parsing and describe/reduction paths pandas loads lazily.
+pd.DataFrame({"a": [1.0], "b": pd.to_datetime(["2025-01-01"])}).describe()
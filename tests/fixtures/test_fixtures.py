@@ -7,10 +7,17 @@ import pandas as pd
 import pytest
 
 
-@pytest.fixture
+def _shared(df):
+    """Yield a module-shared DataFrame and fail teardown if a test mutated it."""
+    snapshot = df.copy()
+    yield df
+    pd.testing.assert_frame_equal(df, snapshot)
+
+
+@pytest.fixture(scope="module")
 def basic_df():
     """Basic DataFrame for simple tests."""
-    return pd.DataFrame(
+    df = pd.DataFrame(
         {
             "id": [1, 2, 3, 4, 5],
             "date": pd.to_datetime(["2025-01-01"] * 5),
@@ -18,33 +25,39 @@ def basic_df():
             "category": ["A", "B", "A", "B", "A"],
         }
     )
+    yield from _shared(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multi_date_df():
     """DataFrame with multiple dates for temporal analysis."""
-    dates = ["2025-01-01", "2025-01-02", "2025-01-03"]
-    data = []
+    dates = pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"])
+    ids, date_values, values, scores, categories = [], [], [], [], []
 
     for i, date in enumerate(dates):
         for entity_id in range(1, 6):
-            data.append(
-                {
-                    "id": entity_id,
-                    "date": pd.to_datetime(date),
-                    "value": 10.0 * entity_id + i * 5,  # Trending upward
-                    "score": entity_id + i * 0.1,
-                    "category": ["A", "B", "C"][entity_id % 3],
-                }
-            )
+            ids.append(entity_id)
+            date_values.append(date)
+            values.append(10.0 * entity_id + i * 5)  # Trending upward
+            scores.append(entity_id + i * 0.1)
+            categories.append(["A", "B", "C"][entity_id % 3])
 
-    return pd.DataFrame(data)
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "date": date_values,
+            "value": values,
+            "score": scores,
+            "category": categories,
+        }
+    )
+    yield from _shared(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def messy_data_df():
     """DataFrame with various data quality issues."""
-    return pd.DataFrame(
+    df = pd.DataFrame(
         {
             "id": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
             "date": pd.to_datetime(
@@ -78,12 +91,13 @@ def messy_data_df():
             ],  # Out of 0-100 range
         }
     )
+    yield from _shared(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def duplicate_data_df():
     """DataFrame with various types of duplicates."""
-    return pd.DataFrame(
+    df = pd.DataFrame(
         {
             "id": [1, 2, 3, 3, 3, 4, 5, 5, 6, 7],  # ID duplicates
             "date": pd.to_datetime(
@@ -104,24 +118,26 @@ def duplicate_data_df():
             "exact_duplicate": ["A", "B", "C", "C", "C", "D", "E", "E", "F", "G"],
         }
     )
+    yield from _shared(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_df():
     """Empty DataFrame with correct schema."""
-    return pd.DataFrame(
+    df = pd.DataFrame(
         {
             "id": pd.Series([], dtype="int64"),
             "date": pd.Series([], dtype="datetime64[ns]"),
             "value": pd.Series([], dtype="float64"),
         }
     )
+    yield from _shared(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def single_row_df():
     """DataFrame with only one row."""
-    return pd.DataFrame(
+    df = pd.DataFrame(
         {
             "id": [1],
             "date": pd.to_datetime(["2025-01-01"]),
@@ -129,12 +145,13 @@ def single_row_df():
             "category": ["A"],
         }
     )
+    yield from _shared(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extreme_values_df():
     """DataFrame with extreme statistical values."""
-    return pd.DataFrame(
+    df = pd.DataFrame(
         {
             "id": range(1, 11),
             "date": pd.to_datetime(["2025-01-01"] * 10),
@@ -155,9 +172,10 @@ def extreme_values_df():
             "high_variance": [1, 1000000, 2, 999999, 3, 1000001, 4, 999998, 5, 1000002],
         }
     )
+    yield from _shared(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def correlation_test_df():
     """DataFrame designed for correlation testing."""
     np.random.seed(42)  # For reproducible tests
@@ -176,7 +194,7 @@ def correlation_test_df():
     # Moderate correlation
     moderate_pos = x * 0.7 + np.random.normal(0, 0.5, n)
 
-    return pd.DataFrame(
+    df = pd.DataFrame(
         {
             "id": range(1, n + 1),
             "date": pd.to_datetime(["2025-01-01"] * n),
@@ -187,13 +205,14 @@ def correlation_test_df():
             "moderate_positive": moderate_pos,
         }
     )
+    yield from _shared(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temporal_drift_df():
     """DataFrame showing drift over time."""
     dates = pd.date_range("2025-01-01", periods=10, freq="D")
-    data = []
+    ids, date_values, drifting, stable = [], [], [], []
 
     for i, date in enumerate(dates):
         # Values that drift upward over time
@@ -201,21 +220,24 @@ def temporal_drift_df():
         base_std = 5 + i * 2  # Std increases by 2 each day
 
         for entity_id in range(1, 21):
-            value = np.random.normal(base_mean, base_std)
-            data.append(
-                {
-                    "id": entity_id,
-                    "date": date,
-                    "drifting_value": value,
-                    "stable_value": np.random.normal(50, 5),  # No drift
-                }
-            )
+            ids.append(entity_id)
+            date_values.append(date)
+            drifting.append(np.random.normal(base_mean, base_std))
+            stable.append(np.random.normal(50, 5))  # No drift
 
-    return pd.DataFrame(data)
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "date": date_values,
+            "drifting_value": drifting,
+            "stable_value": stable,
+        }
+    )
+    yield from _shared(df)
 
 
 # Configuration fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def basic_completeness_config():
     """Basic completeness check configuration."""
     return {
@@ -226,7 +248,7 @@ def basic_completeness_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def strict_completeness_config():
     """Strict completeness configuration."""
     return {
@@ -242,7 +264,7 @@ def strict_completeness_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def basic_uniqueness_config():
     """Basic uniqueness check configuration."""
     return {
@@ -253,7 +275,7 @@ def basic_uniqueness_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def range_check_config():
     """Range check configuration."""
     return {
@@ -266,7 +288,7 @@ def range_check_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def statistical_config():
     """Statistical check configuration."""
     return {
@@ -281,7 +303,7 @@ def statistical_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def correlation_config():
     """Correlation check configuration."""
     return {
@@ -300,7 +322,7 @@ def correlation_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def temporal_correlation_config():
     """Temporal correlation configuration."""
     return {
@@ -312,7 +334,7 @@ def temporal_correlation_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def edge_case_configs():
     """Various edge case configurations."""
     return {
@@ -335,7 +357,7 @@ def edge_case_configs():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def metadata_configs():
     """Various metadata configurations."""
     return {
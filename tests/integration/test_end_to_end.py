@@ -30,20 +30,24 @@ class TestEndToEndCSV:
         np.random.seed(42)
 
         # Create data with multiple dates
-        data = []
+        ids, dates, values, scores, categories = [], [], [], [], []
         for date_num in range(1, 4):
             for i in range(1, 51):
-                data.append(
-                    {
-                        "entity_id": i,
-                        "effective_date": f"2025-01-0{date_num}",
-                        "value": np.random.uniform(50, 150),
-                        "score": np.random.uniform(0, 100),
-                        "category": np.random.choice(["A", "B", "C"]),
-                    }
-                )
-
-        df = pd.DataFrame(data)
+                ids.append(i)
+                dates.append(f"2025-01-0{date_num}")
+                values.append(np.random.uniform(50, 150))
+                scores.append(np.random.uniform(0, 100))
+                categories.append(np.random.choice(["A", "B", "C"]))
+
+        df = pd.DataFrame(
+            {
+                "entity_id": ids,
+                "effective_date": dates,
+                "value": values,
+                "score": scores,
+                "category": categories,
+            }
+        )
 
         # Introduce some nulls
         null_indices = np.random.choice(len(df), 5, replace=False)
@@ -8,25 +8,6 @@ from data_quality.core.framework import DataQualityFramework
 from data_quality.managers.check_manager import CheckManager
 from data_quality.utils.constants import CheckStatus, Severity
 
-# Import shared fixtures
-from tests.fixtures.test_fixtures import (
-    basic_completeness_config,
-    basic_df,
-    basic_uniqueness_config,
-    correlation_config,
-    correlation_test_df,
-    duplicate_data_df,
-    edge_case_configs,
-    extreme_values_df,
-    messy_data_df,
-    metadata_configs,
-    multi_date_df,
-    range_check_config,
-    statistical_config,
-    strict_completeness_config,
-    temporal_drift_df,
-)
-
 
 class TestRobustIntegrationScenarios:
     """Integration tests for complex, realistic scenarios."""
@@ -318,25 +299,29 @@ class TestRobustIntegrationScenarios:
         n_dates = 10
 
         dates = pd.date_range("2025-01-01", periods=n_dates, freq="D")
-        data = []
+        ids, date_values, values, categories, scores = [], [], [], [], []
 
         np.random.seed(42)  # For reproducible tests
 
         for date in dates:
             for i in range(n_rows // n_dates):
-                data.append(
-                    {
-                        "id": i + 1,
-                        "date": date,
-                        "value": np.random.normal(100, 15),
-                        "category": np.random.choice(
-                            ["A", "B", "C", None], p=[0.4, 0.3, 0.2, 0.1]
-                        ),
-                        "score": np.random.uniform(1, 5),
-                    }
+                ids.append(i + 1)
+                date_values.append(date)
+                values.append(np.random.normal(100, 15))
+                categories.append(
+                    np.random.choice(["A", "B", "C", None], p=[0.4, 0.3, 0.2, 0.1])
                 )
+                scores.append(np.random.uniform(1, 5))
 
-        large_df = pd.DataFrame(data)
+        large_df = pd.DataFrame(
+            {
+                "id": ids,
+                "date": date_values,
+                "value": values,
+                "category": categories,
+                "score": scores,
+            }
+        )
 
         checks_config = {
             "completeness": {
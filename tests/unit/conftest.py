@@ -0,0 +1,20 @@
+"""Shared pytest fixtures for unit tests."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="session")
+def baseline_normal_100():
+    """100 draws from normal(100, 10), generated once per session (read-only)."""
+    values = np.random.default_rng(42).normal(100, 10, 100)
+    values.flags.writeable = False
+    return values
+
+
+@pytest.fixture(scope="session")
+def shifted_normal_100():
+    """100 draws from normal(105, 12), generated once per session (read-only)."""
+    values = np.random.default_rng(43).normal(105, 12, 100)
+    values.flags.writeable = False
+    return values
@@ -9,93 +9,121 @@ import pytest
 from data_quality.checks.distribution import DistributionCheck
 from data_quality.utils.constants import CheckStatus
 
+_D1 = pd.Timestamp("2025-01-01")
+_D2 = pd.Timestamp("2025-01-02")
+_PERIODS = pd.DatetimeIndex([_D1, _D2]).values
+
+_IDS_100 = tuple(f"id_{i}" for i in range(100))
+_IDS_50 = _IDS_100[:50]
+
+
+def _rng():
+    """Return a freshly seeded generator so each test draws the same values."""
+    return np.random.default_rng(42)
+
+
+_DISTRIBUTION_CONFIG = {
+    "value": {
+        "thresholds": {"absolute_critical": 0.05},
+        "description": "Value distribution check",
+    }
+}
+_MISSING_COLUMN_CONFIG = {"missing_column": {"thresholds": {"absolute_critical": 0.05}}}
+_DISABLED_CONFIG = {
+    "value": {"enabled": False, "thresholds": {"absolute_critical": 0.05}}
+}
+
+
+def _single_date_df():
+    """Ten points on a single date."""
+    return pd.DataFrame(
+        {
+            "effective_date": np.repeat(_D1, 10),
+            "entity_id": _IDS_100[:10],
+            "value": np.arange(10),
+        }
+    )
+
+
+def _two_point_df():
+    """One point on each of two dates."""
+    return pd.DataFrame(
+        {
+            "effective_date": _PERIODS,
+            "entity_id": ["id_1", "id_2"],
+            "value": [1, 2],
+        }
+    )
+
+
+def _empty_df():
+    """Empty frame with the expected columns."""
+    return pd.DataFrame(columns=["effective_date", "entity_id", "value"])
+
 
 class TestDistributionCheck:
     """Test cases for DistributionCheck class."""
 
-    @pytest.fixture
-    def sample_data(self):
-        """Create sample data for testing."""
-        np.random.seed(42)
-        data = []
-
-        # First period - normal distribution
-        for i in range(100):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-01"),
-                    "entity_id": f"id_{i}",
-                    "value": np.random.normal(100, 10),
-                }
-            )
-
-        # Second period - slightly different distribution
-        for i in range(100):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-02"),
-                    "entity_id": f"id_{i}",
-                    "value": np.random.normal(105, 12),
-                }
-            )
-
-        return pd.DataFrame(data)
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def sample_data(self, baseline_normal_100, shifted_normal_100):
+        """Create sample data for testing (shared read-only across the module)."""
+        # Second period has a slightly different distribution
+        return pd.DataFrame(
+            {
+                "effective_date": np.repeat(_PERIODS, 100),
+                "entity_id": pd.Categorical(_IDS_100 * 2),
+                "value": np.concatenate([baseline_normal_100, shifted_normal_100]),
+            }
+        )
+
+    @pytest.fixture(scope="module")
     def distribution_config(self):
         """Distribution check configuration."""
-        return {
-            "value": {
-                "thresholds": {"absolute_critical": 0.05},
-                "description": "Value distribution check",
-            }
-        }
+        return _DISTRIBUTION_CONFIG
 
-    def test_distribution_check_basic(self, sample_data, distribution_config):
-        """Test basic distribution check functionality."""
-        check = DistributionCheck(
+    @pytest.fixture(scope="module")
+    def basic_result(self, sample_data, distribution_config):
+        """Result of running the check once over the shared sample data."""
+        return DistributionCheck(
             df=sample_data,
             date_col="effective_date",
             id_col="entity_id",
             check_config=distribution_config,
-        )
+        ).run()
 
-        result = check.run()
+    def test_distribution_check_basic(self, basic_result):
+        """Test basic distribution check produces a single result row."""
+        assert not basic_result.empty
+        assert len(basic_result) == 1
 
-        assert not result.empty
-        assert len(result) == 1
-        assert result.iloc[0]["check_type"] == "distribution"
-        assert result.iloc[0]["column"] == "value"
-        assert "ks_statistic" in result.iloc[0]["additional_metrics"]
-        assert "p_value" in result.iloc[0]["additional_metrics"]
+    def test_distribution_check_basic_identity(self, basic_result):
+        """Test basic distribution check reports its type and column."""
+        assert basic_result["check_type"].iat[0] == "distribution"
+        assert basic_result["column"].iat[0] == "value"
+
+    def test_distribution_check_basic_metrics(self, basic_result):
+        """Test basic distribution check reports its additional metrics."""
+        additional_metrics = basic_result["additional_metrics"].iat[0]
+        assert "ks_statistic" in additional_metrics
+        assert "p_value" in additional_metrics
 
     def test_distribution_check_significant_change(self, distribution_config):
         """Test distribution check with significant change."""
         # Create data with very different distributions
-        np.random.seed(42)
-        data = []
+        rng = _rng()
 
         # First period - normal(0, 1)
-        for i in range(100):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-01"),
-                    "entity_id": f"id_{i}",
-                    "value": np.random.normal(0, 1),
-                }
-            )
-
+        baseline = rng.normal(0, 1, 100)
         # Second period - normal(10, 1) - very different
-        for i in range(100):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-02"),
-                    "entity_id": f"id_{i}",
-                    "value": np.random.normal(10, 1),
-                }
-            )
+        current = rng.normal(10, 1, 100)
 
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(
+            {
+                "effective_date": np.repeat(_PERIODS, 100),
+                "entity_id": _IDS_100 * 2,
+                "value": np.concatenate([baseline, current]),
+            }
+        )
 
         check = DistributionCheck(
             df=df,
@@ -112,50 +140,17 @@ class TestDistributionCheck:
 
     def test_distribution_check_no_change(self, distribution_config):
         """Test distribution check with identical distributions."""
-        np.random.seed(42)
-        data = []
+        rng = _rng()
 
         # Both periods - identical distribution
-        for period, date in enumerate(
-            [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-02")]
-        ):
-            for i in range(100):
-                data.append(
-                    {
-                        "effective_date": date,
-                        "entity_id": f"id_{i}",
-                        "value": np.random.normal(100, 10),
-                    }
-                )
-
-        df = pd.DataFrame(data)
-
-        check = DistributionCheck(
-            df=df,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=distribution_config,
+        df = pd.DataFrame(
+            {
+                "effective_date": np.repeat(_PERIODS, 100),
+                "entity_id": _IDS_100 * 2,
+                "value": rng.normal(100, 10, 200),
+            }
         )
 
-        result = check.run()
-
-        assert not result.empty
-        assert result.iloc[0]["status"] == CheckStatus.PASS
-
-    def test_distribution_check_insufficient_dates(self, distribution_config):
-        """Test distribution check with insufficient dates."""
-        data = []
-        for i in range(10):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-01"),
-                    "entity_id": f"id_{i}",
-                    "value": i,
-                }
-            )
-
-        df = pd.DataFrame(data)
-
         check = DistributionCheck(
             df=df,
             date_col="effective_date",
@@ -167,40 +162,58 @@ class TestDistributionCheck:
 
         assert not result.empty
         assert result.iloc[0]["status"] == CheckStatus.PASS
-        assert "Insufficient dates" in result.iloc[0]["additional_metrics"]["message"]
-
-    def test_distribution_check_insufficient_data(self, distribution_config):
-        """Test distribution check with insufficient data points."""
-        data = [
-            {
-                "effective_date": pd.Timestamp("2025-01-01"),
-                "entity_id": "id_1",
-                "value": 1,
-            },
-            {
-                "effective_date": pd.Timestamp("2025-01-02"),
-                "entity_id": "id_2",
-                "value": 2,
-            },
-        ]
-
-        df = pd.DataFrame(data)
 
+    @pytest.mark.parametrize(
+        "make_df,config,expected_status,expected_message",
+        [
+            (
+                _single_date_df,
+                _DISTRIBUTION_CONFIG,
+                CheckStatus.PASS,
+                "Insufficient dates",
+            ),
+            (
+                _two_point_df,
+                _DISTRIBUTION_CONFIG,
+                CheckStatus.PASS,
+                "Insufficient data for KS test",
+            ),
+            (_empty_df, _DISTRIBUTION_CONFIG, CheckStatus.PASS, "Insufficient dates"),
+            (_two_point_df, _MISSING_COLUMN_CONFIG, CheckStatus.ERROR, "not found"),
+            (_two_point_df, _DISABLED_CONFIG, None, None),
+        ],
+        ids=[
+            "insufficient_dates",
+            "insufficient_data",
+            "empty_dataframe",
+            "missing_column",
+            "disabled_column",
+        ],
+    )
+    def test_distribution_check_edge_cases(
+        self, make_df, config, expected_status, expected_message
+    ):
+        """Test distribution check on degenerate inputs and configurations."""
         check = DistributionCheck(
-            df=df,
+            df=make_df(),
             date_col="effective_date",
             id_col="entity_id",
-            check_config=distribution_config,
+            check_config=config,
         )
 
         result = check.run()
 
+        if expected_status is None:
+            assert result.empty
+            return
+
         assert not result.empty
-        assert result.iloc[0]["status"] == CheckStatus.PASS
-        assert (
-            "Insufficient data for KS test"
-            in result.iloc[0]["additional_metrics"]["message"]
-        )
+        record = result.iloc[0]
+        assert record["status"] == expected_status
+        if expected_status == CheckStatus.ERROR:
+            assert expected_message in record["error_message"]
+        else:
+            assert expected_message in record["additional_metrics"]["message"]
 
     def test_distribution_check_with_filter(self, sample_data):
         """Test distribution check with filter condition."""
@@ -224,58 +237,19 @@ class TestDistributionCheck:
         assert not result.empty
         assert result.iloc[0]["filter_applied"] == 'entity_id.str.contains("1")'
 
-    def test_distribution_check_missing_column(self, sample_data, distribution_config):
-        """Test distribution check with missing column."""
-        config = {"missing_column": {"thresholds": {"absolute_critical": 0.05}}}
-
-        check = DistributionCheck(
-            df=sample_data,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=config,
-        )
-
-        result = check.run()
-
-        assert not result.empty
-        assert result.iloc[0]["status"] == "ERROR"
-        assert "not found" in result.iloc[0]["error_message"]
-
-    def test_distribution_check_disabled_column(self, sample_data):
-        """Test distribution check with disabled column."""
-        config = {
-            "value": {"enabled": False, "thresholds": {"absolute_critical": 0.05}}
-        }
-
-        check = DistributionCheck(
-            df=sample_data,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=config,
-        )
-
-        result = check.run()
-
-        assert result.empty
-
     def test_distribution_check_with_nulls(self, distribution_config):
         """Test distribution check with null values."""
-        data = []
-
-        # Add data with nulls
-        for period, date in enumerate(
-            [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-02")]
-        ):
-            for i in range(50):
-                data.append(
-                    {
-                        "effective_date": date,
-                        "entity_id": f"id_{i}",
-                        "value": i if i % 5 != 0 else None,  # Every 5th value is null
-                    }
-                )
-
-        df = pd.DataFrame(data)
+        # Every 5th value is null
+        values = np.arange(50, dtype=float)
+        values[::5] = np.nan
+
+        df = pd.DataFrame(
+            {
+                "effective_date": np.repeat(_PERIODS, 50),
+                "entity_id": _IDS_50 * 2,
+                "value": np.tile(values, 2),
+            }
+        )
 
         check = DistributionCheck(
             df=df,
@@ -311,20 +285,3 @@ class TestDistributionCheck:
 
         assert not result.empty
         assert result.iloc[0]["status"] == "ERROR"
-
-    def test_distribution_check_empty_dataframe(self, distribution_config):
-        """Test distribution check with empty DataFrame."""
-        df = pd.DataFrame(columns=["effective_date", "entity_id", "value"])
-
-        check = DistributionCheck(
-            df=df,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=distribution_config,
-        )
-
-        result = check.run()
-
-        assert not result.empty
-        assert result.iloc[0]["status"] == CheckStatus.PASS
-        assert "Insufficient dates" in result.iloc[0]["additional_metrics"]["message"]
@@ -1,5 +1,7 @@
 """Test cases for drift check."""
 
+import operator
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -7,95 +9,125 @@ import pytest
 from data_quality.checks.drift import DriftCheck
 from data_quality.utils.constants import PSI_MODERATE_DRIFT, PSI_NO_DRIFT, CheckStatus
 
+_D1 = pd.Timestamp("2025-01-01")
+_D2 = pd.Timestamp("2025-01-02")
+_PERIODS = pd.DatetimeIndex([_D1, _D2]).values
+
+_IDS_100 = tuple(f"id_{i}" for i in range(100))
+_IDS_50 = _IDS_100[:50]
+
+
+def _rng():
+    """Return a freshly seeded generator so each test draws the same values."""
+    return np.random.default_rng(42)
+
+
+_DRIFT_CONFIG = {
+    "value": {
+        "thresholds": {
+            "absolute_critical": PSI_MODERATE_DRIFT,
+            "absolute_warning": PSI_NO_DRIFT,
+        },
+        "description": "Value drift check",
+    }
+}
+_MISSING_COLUMN_CONFIG = {
+    "missing_column": {"thresholds": {"absolute_critical": PSI_MODERATE_DRIFT}}
+}
+_DISABLED_CONFIG = {
+    "value": {"enabled": False, "thresholds": {"absolute_critical": PSI_MODERATE_DRIFT}}
+}
+
+
+def _single_date_df():
+    """Twenty points on a single date."""
+    return pd.DataFrame(
+        {
+            "effective_date": np.repeat(_D1, 20),
+            "entity_id": _IDS_100[:20],
+            "value": np.arange(20),
+        }
+    )
+
+
+def _five_point_df():
+    """Only 5 points on each of two dates."""
+    return pd.DataFrame(
+        {
+            "effective_date": np.repeat(_PERIODS, 5),
+            "entity_id": _IDS_100[:5] * 2,
+            "value": np.tile(np.arange(5), 2),
+        }
+    )
+
+
+def _empty_df():
+    """Empty frame with the expected columns."""
+    return pd.DataFrame(columns=["effective_date", "entity_id", "value"])
+
 
 class TestDriftCheck:
     """Test cases for DriftCheck class."""
 
-    @pytest.fixture
-    def sample_data(self):
-        """Create sample data for testing."""
-        np.random.seed(42)
-        data = []
-
-        # Baseline period
-        for i in range(100):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-01"),
-                    "entity_id": f"id_{i}",
-                    "value": np.random.normal(100, 10),
-                }
-            )
-
-        # Current period - slightly different distribution
-        for i in range(100):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-02"),
-                    "entity_id": f"id_{i}",
-                    "value": np.random.normal(105, 12),
-                }
-            )
-
-        return pd.DataFrame(data)
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def sample_data(self, baseline_normal_100, shifted_normal_100):
+        """Create sample data for testing (shared read-only across the module)."""
+        # Second period has a slightly different distribution
+        return pd.DataFrame(
+            {
+                "effective_date": np.repeat(_PERIODS, 100),
+                "entity_id": pd.Categorical(_IDS_100 * 2),
+                "value": np.concatenate([baseline_normal_100, shifted_normal_100]),
+            }
+        )
+
+    @pytest.fixture(scope="module")
     def drift_config(self):
         """Drift check configuration."""
-        return {
-            "value": {
-                "thresholds": {
-                    "absolute_critical": PSI_MODERATE_DRIFT,
-                    "absolute_warning": PSI_NO_DRIFT,
-                },
-                "description": "Value drift check",
-            }
-        }
+        return _DRIFT_CONFIG
 
-    def test_drift_check_basic(self, sample_data, drift_config):
-        """Test basic drift check functionality."""
-        check = DriftCheck(
+    @pytest.fixture(scope="module")
+    def basic_result(self, sample_data, drift_config):
+        """Result of running the check once over the shared sample data."""
+        return DriftCheck(
             df=sample_data,
             date_col="effective_date",
             id_col="entity_id",
             check_config=drift_config,
-        )
+        ).run()
 
-        result = check.run()
+    def test_drift_check_basic(self, basic_result):
+        """Test basic drift check produces a single result row."""
+        assert not basic_result.empty
+        assert len(basic_result) == 1
 
-        assert not result.empty
-        assert len(result) == 1
-        assert result.iloc[0]["check_type"] == "drift"
-        assert result.iloc[0]["column"] == "value"
-        assert "psi" in result.iloc[0]["additional_metrics"]
-        assert "interpretation" in result.iloc[0]["additional_metrics"]
+    def test_drift_check_basic_identity(self, basic_result):
+        """Test basic drift check reports its type and column."""
+        assert basic_result["check_type"].iat[0] == "drift"
+        assert basic_result["column"].iat[0] == "value"
+
+    def test_drift_check_basic_metrics(self, basic_result):
+        """Test basic drift check reports its additional metrics."""
+        additional_metrics = basic_result["additional_metrics"].iat[0]
+        assert "psi" in additional_metrics
+        assert "interpretation" in additional_metrics
 
     def test_drift_check_significant_drift(self, drift_config):
         """Test drift check with significant drift."""
-        np.random.seed(42)
-        data = []
+        rng = _rng()
 
         # Baseline - normal(0, 1)
-        for i in range(100):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-01"),
-                    "entity_id": f"id_{i}",
-                    "value": np.random.normal(0, 1),
-                }
-            )
-
+        baseline = rng.normal(0, 1, 100)
         # Current - exponential distribution (very different)
-        for i in range(100):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-02"),
-                    "entity_id": f"id_{i}",
-                    "value": np.random.exponential(2),
-                }
-            )
+        current = rng.exponential(2, 100)
 
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(
+            {
+                "effective_date": np.repeat(_PERIODS, 100),
+                "entity_id": _IDS_100 * 2,
+                "value": np.concatenate([baseline, current]),
+            }
+        )
 
         check = DriftCheck(
             df=df,
@@ -110,26 +142,16 @@ class TestDriftCheck:
         assert result.iloc[0]["status"] in [CheckStatus.WARNING, CheckStatus.FAIL]
         assert result.iloc[0]["additional_metrics"]["psi"] > 0
 
-    def test_drift_check_no_drift(self, drift_config):
+    def test_drift_check_no_drift(self, drift_config, baseline_normal_100):
         """Test drift check with no drift."""
-        np.random.seed(42)
-        data = []
-
-        # Both periods - identical distribution
-        for period, date in enumerate(
-            [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-02")]
-        ):
-            np.random.seed(42)  # Same seed for identical distributions
-            for i in range(100):
-                data.append(
-                    {
-                        "effective_date": date,
-                        "entity_id": f"id_{i}",
-                        "value": np.random.normal(100, 10),
-                    }
-                )
-
-        df = pd.DataFrame(data)
+        # Both periods share the same values, so they are identical by construction
+        df = pd.DataFrame(
+            {
+                "effective_date": np.repeat(_PERIODS, 100),
+                "entity_id": _IDS_100 * 2,
+                "value": np.concatenate([baseline_normal_100, baseline_normal_100]),
+            }
+        )
 
         check = DriftCheck(
             df=df,
@@ -147,112 +169,92 @@ class TestDriftCheck:
             == "No significant drift"
         )
 
-    def test_drift_check_insufficient_dates(self, drift_config):
-        """Test drift check with insufficient dates."""
-        data = []
-        for i in range(20):
-            data.append(
-                {
-                    "effective_date": pd.Timestamp("2025-01-01"),
-                    "entity_id": f"id_{i}",
-                    "value": i,
-                }
-            )
-
-        df = pd.DataFrame(data)
-
+    @pytest.mark.parametrize(
+        "make_df,config,expected_status,expected_message",
+        [
+            (_single_date_df, _DRIFT_CONFIG, CheckStatus.PASS, "Insufficient dates"),
+            (
+                _five_point_df,
+                _DRIFT_CONFIG,
+                CheckStatus.PASS,
+                "Insufficient data for PSI",
+            ),
+            (_empty_df, _DRIFT_CONFIG, CheckStatus.PASS, "Insufficient dates"),
+            (_five_point_df, _MISSING_COLUMN_CONFIG, CheckStatus.ERROR, "not found"),
+            (_five_point_df, _DISABLED_CONFIG, None, None),
+        ],
+        ids=[
+            "insufficient_dates",
+            "insufficient_data",
+            "empty_dataframe",
+            "missing_column",
+            "disabled_column",
+        ],
+    )
+    def test_drift_check_edge_cases(
+        self, make_df, config, expected_status, expected_message
+    ):
+        """Test drift check on degenerate inputs and configurations."""
         check = DriftCheck(
-            df=df,
+            df=make_df(),
             date_col="effective_date",
             id_col="entity_id",
-            check_config=drift_config,
+            check_config=config,
         )
 
         result = check.run()
 
-        assert not result.empty
-        assert result.iloc[0]["status"] == CheckStatus.PASS
-        assert "Insufficient dates" in result.iloc[0]["additional_metrics"]["message"]
-
-    def test_drift_check_insufficient_data(self, drift_config):
-        """Test drift check with insufficient data points."""
-        data = []
-        for period, date in enumerate(
-            [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-02")]
-        ):
-            for i in range(5):  # Only 5 points per period
-                data.append(
-                    {"effective_date": date, "entity_id": f"id_{i}", "value": i}
-                )
-
-        df = pd.DataFrame(data)
-
-        check = DriftCheck(
-            df=df,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=drift_config,
-        )
-
-        result = check.run()
+        if expected_status is None:
+            assert result.empty
+            return
 
         assert not result.empty
-        assert result.iloc[0]["status"] == CheckStatus.PASS
-        assert (
-            "Insufficient data for PSI"
-            in result.iloc[0]["additional_metrics"]["message"]
-        )
-
-    def test_calculate_psi_identical_distributions(self, sample_data, drift_config):
-        """Test PSI calculation with identical distributions."""
-        check = DriftCheck(
+        record = result.iloc[0]
+        assert record["status"] == expected_status
+        if expected_status == CheckStatus.ERROR:
+            assert expected_message in record["error_message"]
+        else:
+            assert expected_message in record["additional_metrics"]["message"]
+
+    @pytest.fixture(scope="module")
+    def drift_check_instance(self, sample_data, drift_config):
+        """Shared DriftCheck used to exercise PSI calculation directly."""
+        return DriftCheck(
             df=sample_data,
             date_col="effective_date",
             id_col="entity_id",
             check_config=drift_config,
         )
 
-        # Create identical series
-        baseline = pd.Series([1, 2, 3, 4, 5] * 20)
-        current = pd.Series([1, 2, 3, 4, 5] * 20)
-
-        psi = check._calculate_psi(baseline, current)
-
-        assert psi < 0.1  # Should be very low for identical distributions
-
-    def test_calculate_psi_different_distributions(self, sample_data, drift_config):
-        """Test PSI calculation with different distributions."""
-        check = DriftCheck(
-            df=sample_data,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=drift_config,
-        )
-
-        # Create different distributions
-        baseline = pd.Series(np.random.normal(0, 1, 100))
-        current = pd.Series(np.random.normal(5, 1, 100))
-
-        psi = check._calculate_psi(baseline, current)
-
-        assert psi > 0.1  # Should be higher for different distributions
-
-    def test_calculate_psi_constant_values(self, sample_data, drift_config):
-        """Test PSI calculation with constant values."""
-        check = DriftCheck(
-            df=sample_data,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=drift_config,
-        )
-
-        # All same values
-        baseline = pd.Series([5] * 100)
-        current = pd.Series([5] * 100)
-
-        psi = check._calculate_psi(baseline, current)
-
-        assert psi == 0.0  # Should be 0 for constant values
+    @pytest.mark.parametrize(
+        "baseline,current,compare,bound",
+        [
+            # Should be very low for identical distributions
+            (
+                np.tile([1, 2, 3, 4, 5], 20),
+                np.tile([1, 2, 3, 4, 5], 20),
+                operator.lt,
+                0.1,
+            ),
+            # Should be higher for different distributions
+            (
+                _rng().normal(0, 1, 100),
+                _rng().normal(5, 1, 100),
+                operator.gt,
+                0.1,
+            ),
+            # Should be 0 for constant values
+            (np.full(100, 5), np.full(100, 5), operator.eq, 0.0),
+        ],
+        ids=["identical_distributions", "different_distributions", "constant_values"],
+    )
+    def test_calculate_psi(
+        self, drift_check_instance, baseline, current, compare, bound
+    ):
+        """Test PSI calculation across distribution scenarios."""
+        psi = drift_check_instance._calculate_psi(baseline, current)
+
+        assert compare(psi, bound)
 
     def test_drift_check_with_filter(self, sample_data):
         """Test drift check with filter condition."""
@@ -279,63 +281,19 @@ class TestDriftCheck:
         assert not result.empty
         assert result.iloc[0]["filter_applied"] == 'entity_id.str.contains("1")'
 
-    def test_drift_check_missing_column(self, sample_data, drift_config):
-        """Test drift check with missing column."""
-        config = {
-            "missing_column": {"thresholds": {"absolute_critical": PSI_MODERATE_DRIFT}}
-        }
-
-        check = DriftCheck(
-            df=sample_data,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=config,
-        )
-
-        result = check.run()
-
-        assert not result.empty
-        assert result.iloc[0]["status"] == "ERROR"
-        assert "not found" in result.iloc[0]["error_message"]
-
-    def test_drift_check_disabled_column(self, sample_data):
-        """Test drift check with disabled column."""
-        config = {
-            "value": {
-                "enabled": False,
-                "thresholds": {"absolute_critical": PSI_MODERATE_DRIFT},
-            }
-        }
-
-        check = DriftCheck(
-            df=sample_data,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=config,
-        )
-
-        result = check.run()
-
-        assert result.empty
-
     def test_drift_check_with_nulls(self, drift_config):
         """Test drift check with null values."""
-        data = []
-
-        # Add data with nulls
-        for period, date in enumerate(
-            [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-02")]
-        ):
-            for i in range(50):
-                data.append(
-                    {
-                        "effective_date": date,
-                        "entity_id": f"id_{i}",
-                        "value": i if i % 5 != 0 else None,  # Every 5th value is null
-                    }
-                )
-
-        df = pd.DataFrame(data)
+        # Every 5th value is null
+        values = np.arange(50, dtype=float)
+        values[::5] = np.nan
+
+        df = pd.DataFrame(
+            {
+                "effective_date": np.repeat(_PERIODS, 50),
+                "entity_id": _IDS_50 * 2,
+                "value": np.tile(values, 2),
+            }
+        )
 
         check = DriftCheck(
             df=df,
@@ -369,20 +327,3 @@ class TestDriftCheck:
 
         assert not result.empty
         assert result.iloc[0]["status"] == "ERROR"
-
-    def test_drift_check_empty_dataframe(self, drift_config):
-        """Test drift check with empty DataFrame."""
-        df = pd.DataFrame(columns=["effective_date", "entity_id", "value"])
-
-        check = DriftCheck(
-            df=df,
-            date_col="effective_date",
-            id_col="entity_id",
-            check_config=drift_config,
-        )
-
-        result = check.run()
-
-        assert not result.empty
-        assert result.iloc[0]["status"] == CheckStatus.PASS
-        assert "Insufficient dates" in result.iloc[0]["additional_metrics"]["message"]
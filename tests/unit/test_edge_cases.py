@@ -13,10 +13,79 @@ from data_quality.core.exceptions import FilterError
 from data_quality.managers.check_manager import CheckManager
 from data_quality.utils.constants import CheckStatus
 
-# Import fixtures
-from tests.fixtures.test_fixtures import *
+_DATE = np.datetime64("2025-01-01", "ns")
 
 
+def _dates(n):
+    """Return ``n`` copies of 2025-01-01 as datetime64[ns]."""
+    return np.full(n, _DATE)
+
+
+def _all_null_df():
+    """Frame whose only check column is entirely null."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "date": _dates(3),
+            "all_null": [None, np.nan, None],
+        }
+    )
+
+
+def _all_duplicates_df():
+    """Frame where every value is the same."""
+    return pd.DataFrame(
+        {
+            "id": [1, 1, 1, 1, 1],  # All same value
+            "date": _dates(5),
+            "value": [42] * 5,
+        }
+    )
+
+
+def _nulls_and_duplicates_df():
+    """Frame mixing nulls and duplicated values."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "date": _dates(5),
+            "value": [10, None, 10, np.nan, 20],  # Nulls and duplicates
+        }
+    )
+
+
+def _near_constant_df():
+    """Frame with one value just outside a single-point range."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "date": _dates(3),
+            "value": [42, 42, 43],  # One value out of range
+        }
+    )
+
+
+def _simple_values_df():
+    """Small frame of plain integer values."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "date": _dates(3),
+            "value": [10, 20, 30],
+        }
+    )
+
+
+def _assert_first_result(results, expected_status, expected_metric):
+    """Check the first result row; ``None`` skips that expectation."""
+    assert len(results) > 0
+    if expected_status is not None:
+        assert results["status"].iat[0] == expected_status
+    if expected_metric is not None:
+        assert results["metric_value"].iat[0] == expected_metric
+
+
+@pytest.mark.xdist_group(name="completeness_edge")
 class TestEdgeCasesCompleteness:
     """Edge case tests for CompletenessCheck."""
 
@@ -32,21 +101,8 @@ class TestEdgeCasesCompleteness:
         )
 
         results = check.run()
-        assert len(results) > 0
         # Inf values should be treated as non-null
-
-    def test_completeness_empty_dataframe(self, empty_df, basic_completeness_config):
-        """Test completeness with empty DataFrame."""
-        check = CompletenessCheck(
-            df=empty_df,
-            date_col="date",
-            id_col="id",
-            check_config=basic_completeness_config,
-        )
-
-        results = check.run()
-        # Empty dataframe may still return a result record with 0 metric
-        assert len(results) >= 0
+        assert len(results) == 1
 
     def test_completeness_single_row(self, single_row_df, basic_completeness_config):
         """Test completeness with single row."""
@@ -59,35 +115,27 @@ class TestEdgeCasesCompleteness:
 
         results = check.run()
         assert len(results) > 0
-        assert results.iloc[0]["metric_value"] == 0.0  # 100% complete
+        assert results["metric_value"].iat[0] == 0.0  # 100% complete
 
     def test_completeness_all_null_column(self):
         """Test completeness with completely null column."""
-        df = pd.DataFrame(
-            {
-                "id": [1, 2, 3],
-                "date": pd.to_datetime(["2025-01-01"] * 3),
-                "all_null": [None, np.nan, None],
-            }
-        )
-
         config = {"all_null": {"thresholds": {"absolute_critical": 0.5}}}
 
         check = CompletenessCheck(
-            df=df, date_col="date", id_col="id", check_config=config
+            df=_all_null_df(), date_col="date", id_col="id", check_config=config
         )
-        results = check.run()
 
-        assert len(results) > 0
-        assert results.iloc[0]["metric_value"] == 1.0  # 100% missing
-        assert results.iloc[0]["status"] == CheckStatus.FAIL
+        # 100% missing
+        _assert_first_result(check.run(), CheckStatus.FAIL, 1.0)
 
-    def test_completeness_invalid_filter(self, basic_df):
+    @pytest.mark.parametrize("path", ["apply_filter", "run"])
+    def test_completeness_invalid_filter(self, basic_df, path):
         """Test completeness with invalid filter condition."""
+        filter_condition = "invalid_column > 0"  # Column doesn't exist
         config = {
             "value": {
                 "thresholds": {"absolute_critical": 0.2},
-                "filter_condition": "invalid_column > 0",  # Column doesn't exist
+                "filter_condition": filter_condition,
             }
         }
 
@@ -95,61 +143,48 @@ class TestEdgeCasesCompleteness:
             df=basic_df, date_col="date", id_col="id", check_config=config
         )
 
-        # May raise FilterError or handle gracefully with error result
-        try:
+        if path == "apply_filter":
+            # The filter helper raises directly
+            with pytest.raises(FilterError):
+                check._apply_filter(check.df, filter_condition)
+        else:
+            # run() catches the FilterError and reports an error result
             results = check.run()
-            # If no exception, should have error result
-            assert any(
-                r.get("status") == CheckStatus.ERROR for r in results.to_dict("records")
-            )
-        except FilterError:
-            # Expected behavior
-            pass
+            assert results["status"].eq(CheckStatus.ERROR).any()
+            assert results["error_type"].iat[0] == "FilterError"
 
 
+@pytest.mark.xdist_group(name="uniqueness_edge")
 class TestEdgeCasesUniqueness:
     """Edge case tests for UniquenessCheck."""
 
-    def test_uniqueness_all_duplicates(self):
-        """Test uniqueness when all values are duplicates."""
-        df = pd.DataFrame(
-            {
-                "id": [1, 1, 1, 1, 1],  # All same value
-                "date": pd.to_datetime(["2025-01-01"] * 5),
-                "value": [42] * 5,
-            }
-        )
-
-        config = {"value": {"thresholds": {"absolute_critical": 0}}}
-
+    @pytest.mark.parametrize(
+        "build_df,config,expected_status,expected_metric",
+        [
+            # 4 duplicates
+            (
+                _all_duplicates_df,
+                {"value": {"thresholds": {"absolute_critical": 0}}},
+                CheckStatus.FAIL,
+                4,
+            ),
+            # Nulls are handled without error; 10 is still duplicated
+            (
+                _nulls_and_duplicates_df,
+                {"value": {"thresholds": {"absolute_critical": 0}}},
+                CheckStatus.FAIL,
+                None,
+            ),
+        ],
+        ids=["all_duplicates", "with_nulls"],
+    )
+    def test_uniqueness_edge(self, build_df, config, expected_status, expected_metric):
+        """Test uniqueness across built edge-case frames."""
         check = UniquenessCheck(
-            df=df, date_col="date", id_col="id", check_config=config
-        )
-        results = check.run()
-
-        assert len(results) > 0
-        assert results.iloc[0]["metric_value"] == 4  # 4 duplicates
-        assert results.iloc[0]["status"] == CheckStatus.FAIL
-
-    def test_uniqueness_with_nulls(self):
-        """Test uniqueness handling of null values."""
-        df = pd.DataFrame(
-            {
-                "id": [1, 2, 3, 4, 5],
-                "date": pd.to_datetime(["2025-01-01"] * 5),
-                "value": [10, None, 10, np.nan, 20],  # Nulls and duplicates
-            }
+            df=build_df(), date_col="date", id_col="id", check_config=config
         )
 
-        config = {"value": {"thresholds": {"absolute_critical": 0}}}
-
-        check = UniquenessCheck(
-            df=df, date_col="date", id_col="id", check_config=config
-        )
-        results = check.run()
-
-        assert len(results) > 0
-        # Should find 1 duplicate (10 appears twice), nulls ignored
+        _assert_first_result(check.run(), expected_status, expected_metric)
 
     def test_uniqueness_extreme_duplicates(self, duplicate_data_df):
         """Test uniqueness with extreme duplicate counts."""
@@ -167,22 +202,57 @@ class TestEdgeCasesUniqueness:
         results = check.run()
         assert len(results) == 2
 
+        status = results.set_index("column")["status"]
         # ID check should pass (high threshold)
-        id_result = results[results["column"] == "id"].iloc[0]
-        assert id_result["status"] == CheckStatus.PASS
-
+        assert status.loc["id"] == CheckStatus.PASS
         # Exact duplicate check should fail (zero threshold)
-        dup_result = results[results["column"] == "exact_duplicate"].iloc[0]
-        assert dup_result["status"] == CheckStatus.FAIL
+        assert status.loc["exact_duplicate"] == CheckStatus.FAIL
 
 
+@pytest.mark.xdist_group(name="range_edge")
 class TestEdgeCasesRange:
     """Edge case tests for RangeCheck."""
 
+    @pytest.mark.parametrize(
+        "build_df,config,expected_status,expected_metric",
+        [
+            # 43 is out of range
+            (
+                _near_constant_df,
+                {
+                    "value": {
+                        "min_value": 42,
+                        "max_value": 42,  # Exact value required
+                        "description": "Must be exactly 42",
+                    }
+                },
+                CheckStatus.FAIL,
+                None,
+            ),
+            # No bounds = always pass
+            (
+                _simple_values_df,
+                {"value": {"description": "No bounds specified"}},
+                CheckStatus.PASS,
+                None,
+            ),
+        ],
+        ids=["min_equals_max", "no_bounds_specified"],
+    )
+    def test_range_edge(self, build_df, config, expected_status, expected_metric):
+        """Test range check across built edge-case frames."""
+        check = RangeCheck(
+            df=build_df(), date_col="date", id_col="id", check_config=config
+        )
+
+        _assert_first_result(check.run(), expected_status, expected_metric)
+
     def test_range_with_extreme_values(self, extreme_values_df, range_check_config):
         """Test range check with extreme values."""
+        # Work on a copy: the fixture is shared across the module
+        df = extreme_values_df.copy()
         # Add percentage column with extreme values
-        extreme_values_df["percentage"] = [
+        df["percentage"] = [
             -1000,
             2000,
             np.inf,
@@ -196,7 +266,7 @@ class TestEdgeCasesRange:
         ]
 
         check = RangeCheck(
-            df=extreme_values_df,
+            df=df,
             date_col="date",
             id_col="id",
             check_config=range_check_config,
@@ -206,57 +276,11 @@ class TestEdgeCasesRange:
         assert len(results) > 0
 
         # Should detect many out-of-range values
-        percentage_result = results[results["column"] == "percentage"].iloc[0]
-        assert percentage_result["status"] == CheckStatus.FAIL
-
-    def test_range_min_equals_max(self):
-        """Test range check where min equals max."""
-        df = pd.DataFrame(
-            {
-                "id": [1, 2, 3],
-                "date": pd.to_datetime(["2025-01-01"] * 3),
-                "value": [42, 42, 43],  # One value out of range
-            }
-        )
-
-        config = {
-            "value": {
-                "min_value": 42,
-                "max_value": 42,  # Exact value required
-                "description": "Must be exactly 42",
-            }
-        }
-
-        check = RangeCheck(df=df, date_col="date", id_col="id", check_config=config)
-        results = check.run()
-
-        assert len(results) > 0
-        assert results.iloc[0]["status"] == CheckStatus.FAIL  # 43 is out of range
-
-    def test_range_no_bounds_specified(self):
-        """Test range check with no min/max bounds."""
-        df = pd.DataFrame(
-            {
-                "id": [1, 2, 3],
-                "date": pd.to_datetime(["2025-01-01"] * 3),
-                "value": [10, 20, 30],
-            }
-        )
-
-        config = {
-            "value": {
-                "description": "No bounds specified"
-                # No min_value or max_value
-            }
-        }
-
-        check = RangeCheck(df=df, date_col="date", id_col="id", check_config=config)
-        results = check.run()
-
-        assert len(results) > 0
-        assert results.iloc[0]["status"] == CheckStatus.PASS  # No bounds = always pass
+        status = results.set_index("column")["status"]
+        assert status.loc["percentage"] == CheckStatus.FAIL
 
 
+@pytest.mark.xdist_group(name="statistical_edge")
 class TestEdgeCasesStatistical:
     """Edge case tests for StatisticalCheck."""
 
@@ -276,14 +300,11 @@ class TestEdgeCasesStatistical:
         results = check.run()
         assert len(results) == 4
 
+        metric = results.set_index("measure")["metric_value"]
         # Standard deviation should be 0
-        std_result = results[results["measure"] == "std"].iloc[0]
-        assert std_result["metric_value"] == 0.0
-
+        assert metric.loc["std"] == 0.0
         # Min and max should be equal
-        min_result = results[results["measure"] == "min"].iloc[0]
-        max_result = results[results["measure"] == "max"].iloc[0]
-        assert min_result["metric_value"] == max_result["metric_value"]
+        assert metric.loc["min"] == metric.loc["max"]
 
     def test_statistical_extreme_skew_kurtosis(self):
         """Test statistical measures with extreme skew/kurtosis."""
@@ -291,7 +312,7 @@ class TestEdgeCasesStatistical:
         df = pd.DataFrame(
             {
                 "id": range(1, 101),
-                "date": pd.to_datetime(["2025-01-01"] * 100),
+                "date": _dates(100),
                 "skewed": [1] * 95 + [1000] * 5,  # Highly right-skewed
             }
         )
@@ -304,15 +325,15 @@ class TestEdgeCasesStatistical:
         results = check.run()
 
         assert len(results) == 2
-        skew_result = results[results["measure"] == "skew"].iloc[0]
-        assert skew_result["metric_value"] > 2  # Highly skewed
+        metric = results.set_index("measure")["metric_value"]
+        assert metric.loc["skew"] > 2  # Highly skewed
 
     def test_statistical_insufficient_data_for_skew(self):
         """Test statistical measures with insufficient data for skew/kurtosis."""
         df = pd.DataFrame(
             {
                 "id": [1, 2],  # Only 2 rows
-                "date": pd.to_datetime(["2025-01-01"] * 2),
+                "date": _dates(2),
                 "value": [10, 20],
             }
         )
@@ -326,10 +347,11 @@ class TestEdgeCasesStatistical:
 
         assert len(results) == 2
         # Should return 0 for insufficient data
-        skew_result = results[results["measure"] == "skew"].iloc[0]
-        assert skew_result["metric_value"] == 0.0
+        metric = results.set_index("measure")["metric_value"]
+        assert metric.loc["skew"] == 0.0
 
 
+@pytest.mark.xdist_group(name="correlation_edge")
 class TestEdgeCasesCorrelation:
     """Edge case tests for CorrelationCheck."""
 
@@ -349,14 +371,14 @@ class TestEdgeCasesCorrelation:
 
         results = check.run()
         assert len(results) > 0
-        assert abs(results.iloc[0]["metric_value"]) > 0.99  # Nearly perfect correlation
+        assert abs(results["metric_value"].iat[0]) > 0.99  # Nearly perfect correlation
 
     def test_correlation_with_constant_values(self):
         """Test correlation when one column has constant values."""
         df = pd.DataFrame(
             {
                 "id": range(1, 11),
-                "date": pd.to_datetime(["2025-01-01"] * 10),
+                "date": _dates(10),
                 "constant": [42] * 10,  # No variance
                 "variable": range(1, 11),
             }
@@ -377,10 +399,8 @@ class TestEdgeCasesCorrelation:
 
         assert len(results) > 0
         # Correlation with constant should be NaN, but check should handle it
-        assert (
-            pd.isna(results.iloc[0]["metric_value"])
-            or results.iloc[0]["metric_value"] == 0
-        )
+        metric_value = results["metric_value"].iat[0]
+        assert pd.isna(metric_value) or metric_value == 0
 
     def test_correlation_temporal_single_date(self, basic_df):
         """Test temporal correlation with single date."""
@@ -397,10 +417,11 @@ class TestEdgeCasesCorrelation:
         results = check.run()
 
         assert len(results) > 0
-        assert results.iloc[0]["status"] == CheckStatus.PASS
-        assert "Insufficient dates" in results.iloc[0]["additional_metrics"]["message"]
+        assert results["status"].iat[0] == CheckStatus.PASS
+        assert "Insufficient dates" in results["additional_metrics"].iat[0]["message"]
 
 
+@pytest.mark.xdist_group(name="check_manager_edge")
 class TestEdgeCasesCheckManager:
     """Edge case tests for CheckManager."""
 
@@ -443,20 +464,7 @@ class TestEdgeCasesCheckManager:
 
         # Should capture errors in results
         assert results["summary"]["total"] > 0
-        assert any(r.get("status") == CheckStatus.ERROR for r in results["results"])
-
-    def test_check_manager_empty_dataframe(self, empty_df):
-        """Test CheckManager with empty DataFrame."""
-        config = {"completeness": {"value": {"thresholds": {"absolute_critical": 0.1}}}}
-
-        metadata = {"date_column": "date", "id_column": "id"}
-
-        manager = CheckManager(df=empty_df, metadata=metadata, checks_config=config)
-
-        results = manager.run_all_checks()
-
-        # Should handle empty data gracefully - may return 0 or 1 result
-        assert results["summary"]["total"] >= 0
+        assert results["summary"]["errors"] > 0
 
     def test_check_manager_parallel_execution_errors(self, basic_df):
         """Test parallel execution with errors."""
@@ -477,3 +485,40 @@ class TestEdgeCasesCheckManager:
         # Should handle parallel errors gracefully
         assert "summary" in results
         assert "results" in results
+
+
+@pytest.mark.xdist_group(name="empty_edge")
+class TestEdgeCasesEmptyDataFrame:
+    """Empty DataFrame handling shared across check types."""
+
+    @pytest.mark.parametrize(
+        "check_cls,config",
+        [
+            (CompletenessCheck, {"value": {"thresholds": {"absolute_critical": 0.1}}}),
+            (UniquenessCheck, {"id": {"thresholds": {"absolute_critical": 0.1}}}),
+            (RangeCheck, {"value": {"min_value": 0, "max_value": 100}}),
+            (StatisticalCheck, {"value": {"measures": ["mean"], "thresholds": {}}}),
+        ],
+        ids=["completeness", "uniqueness", "range", "statistical"],
+    )
+    def test_empty_df_all_checks(self, empty_df, check_cls, config):
+        """Empty input yields no result or a single zero-metric result."""
+        results = check_cls(
+            df=empty_df, date_col="date", id_col="id", check_config=config
+        ).run()
+
+        assert len(results) in (0, 1)
+        assert results.empty or results["metric_value"].iat[0] == 0.0
+
+    def test_empty_df_check_manager(self, empty_df):
+        """CheckManager runs cleanly over an empty DataFrame."""
+        config = {"completeness": {"value": {"thresholds": {"absolute_critical": 0.1}}}}
+
+        metadata = {"date_column": "date", "id_column": "id"}
+
+        manager = CheckManager(df=empty_df, metadata=metadata, checks_config=config)
+
+        results = manager.run_all_checks()
+
+        assert results["summary"]["total"] in (0, 1)
+        assert results["summary"]["errors"] == 0
@@ -21,6 +21,19 @@ from data_quality.core.exceptions import (
     ValidationError,
 )
 
+_LONG_QUERY = "SELECT " + "a, " * 400 + "b FROM table"
+
+_EXC_CLASSES = (
+    ConfigurationError,
+    ConnectionError,
+    DataRetrievalError,
+    CheckError,
+    FilterError,
+    ValidationError,
+    OutputError,
+    AlertingError,
+)
+
 
 class TestDQFrameworkError:
     """Tests for base DQFrameworkError."""
@@ -36,10 +49,18 @@ class TestDQFrameworkError:
         """Test creating error with context."""
         context = {"key": "value", "number": 42}
         error = DQFrameworkError("Test error", context=context)
-        assert "key=value" in str(error)
-        assert "number=42" in str(error)
+        error_str = str(error)
+        assert "key=value" in error_str
+        assert "number=42" in error_str
         assert error.context == context
 
+    def test_str_reflects_context_updates(self):
+        """Test the message includes context added after construction."""
+        error = DQFrameworkError("Test error")
+        assert str(error) == "Test error"
+        error.context["column"] = "value"
+        assert str(error) == "Test error [column=value]"
+
     def test_is_exception(self):
         """Test that it's a proper exception."""
         with pytest.raises(DQFrameworkError) as exc_info:
@@ -60,22 +81,25 @@ class TestConfigurationError:
         error = ConfigurationError(
             "Invalid value", field_path="checks.completeness.column1"
         )
+        error_str = str(error)
         assert error.field_path == "checks.completeness.column1"
-        assert "field_path=checks.completeness.column1" in str(error)
+        assert "field_path=checks.completeness.column1" in error_str
 
     def test_with_line_number(self):
         """Test with line number specified."""
         error = ConfigurationError("Syntax error", line_number=45)
+        error_str = str(error)
         assert error.line_number == 45
-        assert "line_number=45" in str(error)
+        assert "line_number=45" in error_str
 
     def test_with_suggestion(self):
         """Test with suggestion for fix."""
         error = ConfigurationError(
             "Type error", suggestion="Remove quotes around numeric values"
         )
+        error_str = str(error)
         assert error.suggestion == "Remove quotes around numeric values"
-        assert "suggestion=" in str(error)
+        assert "suggestion=" in error_str
 
     def test_all_fields(self):
         """Test with all optional fields."""
@@ -102,14 +126,16 @@ class TestConnectionError:
     def test_with_connector_type(self):
         """Test with connector type."""
         error = ConnectionError("Auth failed", connector_type="oracle")
+        error_str = str(error)
         assert error.connector_type == "oracle"
-        assert "connector_type=oracle" in str(error)
+        assert "connector_type=oracle" in error_str
 
     def test_with_retry_count(self):
         """Test with retry count."""
         error = ConnectionError("Timeout", retry_count=3)
+        error_str = str(error)
         assert error.retry_count == 3
-        assert "retry_count=3" in str(error)
+        assert "retry_count=3" in error_str
 
 
 class TestDataRetrievalError:
@@ -127,12 +153,13 @@ class TestDataRetrievalError:
         assert error.query == query
         assert query in str(error)
 
-    def test_with_long_query_truncation(self):
-        """Test that long queries are truncated."""
-        long_query = "SELECT " + "a, " * 100 + "b FROM table"
-        error = DataRetrievalError("Failed", query=long_query)
+    @pytest.mark.parametrize("length", [50, 200, 1000])
+    def test_with_long_query_truncation(self, length):
+        """Test that queries longer than 200 characters are truncated."""
+        query = _LONG_QUERY[:length]
+        error = DataRetrievalError("Failed", query=query)
         error_str = str(error)
-        assert "..." in error_str
+        assert ("..." in error_str) is (length > 200)
         assert len(error.context.get("query", "")) <= 203  # 200 + "..."
 
 
@@ -148,14 +175,16 @@ class TestCheckError:
     def test_with_check_type(self):
         """Test with check type."""
         error = CheckError("Failed", check_type="completeness")
+        error_str = str(error)
         assert error.check_type == "completeness"
-        assert "check_type=completeness" in str(error)
+        assert "check_type=completeness" in error_str
 
     def test_with_column(self):
         """Test with column name."""
         error = CheckError("Failed", column="carbon_em")
+        error_str = str(error)
         assert error.column == "carbon_em"
-        assert "column=carbon_em" in str(error)
+        assert "column=carbon_em" in error_str
 
     def test_invalid_threshold_error(self):
         """Test InvalidThresholdError is a CheckError."""
@@ -180,8 +209,9 @@ class TestFilterError:
     def test_with_filter_condition(self):
         """Test with filter condition."""
         error = FilterError("Syntax error", filter_condition="universe == 'US'")
+        error_str = str(error)
         assert error.filter_condition == "universe == 'US'"
-        assert "filter_condition=" in str(error)
+        assert "filter_condition=" in error_str
 
 
 class TestExecutionError:
@@ -251,20 +281,10 @@ class TestOutputAndAlertingErrors:
 class TestExceptionInheritance:
     """Tests for exception hierarchy."""
 
-    def test_all_inherit_from_base(self):
+    @pytest.mark.parametrize("cls", _EXC_CLASSES, ids=lambda c: c.__name__)
+    def test_all_inherit_from_base(self, cls):
         """Test all exceptions inherit from DQFrameworkError."""
-        exceptions = [
-            ConfigurationError("test"),
-            ConnectionError("test"),
-            DataRetrievalError("test"),
-            CheckError("test"),
-            FilterError("test"),
-            ValidationError("test"),
-            OutputError("test"),
-            AlertingError("test"),
-        ]
-        for exc in exceptions:
-            assert isinstance(exc, DQFrameworkError)
+        assert isinstance(cls("test"), DQFrameworkError)
 
     def test_can_catch_with_base(self):
         """Test catching all exceptions with base class."""
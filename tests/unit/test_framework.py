@@ -9,7 +9,7 @@ from data_quality.core.framework import DataQualityFramework, DQResults
 class TestDataQualityFramework:
     """Tests for the DataQualityFramework orchestration class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_df(self):
         """Simple DataFrame used for initialization tests."""
         return pd.DataFrame(
@@ -45,17 +45,18 @@ class TestDataQualityFramework:
         assert framework.output_manager is None
         assert framework.results is None
 
-    def test_run_checks_not_implemented(self, sample_df):
-        """run_checks should currently raise NotImplementedError stub."""
-        framework = DataQualityFramework(df=sample_df)
+    @pytest.fixture(scope="module")
+    def framework(self, sample_df):
+        """Framework instance shared by the stub tests."""
+        return DataQualityFramework(df=sample_df)
 
+    def test_run_checks_not_implemented(self, framework):
+        """run_checks should currently raise NotImplementedError stub."""
         with pytest.raises(NotImplementedError):
             framework.run_checks("2025-01-01", "2025-01-31")
 
-    def test_run_check_not_implemented(self, sample_df):
+    def test_run_check_not_implemented(self, framework):
         """run_check should currently raise NotImplementedError stub."""
-        framework = DataQualityFramework(df=sample_df)
-
         with pytest.raises(NotImplementedError):
             framework.run_check("completeness", {"value": {}})
 
@@ -63,7 +64,7 @@ class TestDataQualityFramework:
 class TestDQResults:
     """Tests for the DQResults container."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_df(self):
         """Sample DataFrame for results container."""
         return pd.DataFrame(
@@ -73,34 +74,26 @@ class TestDQResults:
             }
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def metadata(self):
         """Sample metadata for results container."""
         return {"dq_check_name": "Test Check", "run_id": "abc123"}
 
-    def test_to_dataframe_returns_original_df(self, sample_df, metadata):
-        """to_dataframe should return the underlying DataFrame unchanged."""
-        results = DQResults(results_df=sample_df, metadata=metadata)
+    @pytest.fixture(scope="module")
+    def dq_results(self, sample_df, metadata):
+        """Results container shared across tests."""
+        return DQResults(results_df=sample_df, metadata=metadata)
 
-        df_out = results.to_dataframe()
+    def test_to_dataframe_returns_original_df(self, dq_results, sample_df):
+        """to_dataframe should return the underlying DataFrame unchanged."""
+        df_out = dq_results.to_dataframe()
 
-        assert df_out.equals(sample_df)
+        assert df_out is sample_df
 
-    def test_not_implemented_methods_raise(self, sample_df, metadata):
+    @pytest.mark.parametrize(
+        "method", ["to_json", "to_html", "to_csv", "get_summary", "get_exit_code"]
+    )
+    def test_not_implemented_methods_raise(self, dq_results, method):
         """Export and summary methods should currently raise NotImplementedError."""
-        results = DQResults(results_df=sample_df, metadata=metadata)
-
-        with pytest.raises(NotImplementedError):
-            results.to_json()
-
-        with pytest.raises(NotImplementedError):
-            results.to_html()
-
-        with pytest.raises(NotImplementedError):
-            results.to_csv()
-
-        with pytest.raises(NotImplementedError):
-            results.get_summary()
-
         with pytest.raises(NotImplementedError):
-            results.get_exit_code()
+            getattr(dq_results, method)()
@@ -1,12 +1,17 @@
 """Tests for logging infrastructure."""
 
-import json
+import copy
 import logging
-import os
-import tempfile
+import logging.handlers
+import sys
 
 import pytest
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup for decoding log lines
+    from json import loads as json_loads
+
 from data_quality.utils.logger import (
     ContextAdapter,
     JSONFormatter,
@@ -16,13 +21,46 @@ from data_quality.utils.logger import (
 )
 
 
+def _restore_logger(logger, handlers, level):
+    """Close handlers added since the snapshot and restore the logger state."""
+    for handler in logger.handlers:
+        if handler not in handlers:
+            handler.close()
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+@pytest.fixture(autouse=True)
+def _reset_logger():
+    """Restore the framework logger's handlers and level after each test."""
+    logger = logging.getLogger("data_quality")
+    saved = (logger.handlers[:], logger.level)
+    yield
+    _restore_logger(logger, *saved)
+
+
+@pytest.fixture(scope="class")
+def _debug_logging():
+    """Configure DEBUG logging once for a test class."""
+    logger = logging.getLogger("data_quality")
+    saved = (logger.handlers[:], logger.level)
+    setup_logging(level="DEBUG")
+    yield
+    _restore_logger(logger, *saved)
+
+
 class TestJSONFormatter:
     """Tests for JSONFormatter."""
 
-    def test_format_basic_message(self):
-        """Test formatting basic log message."""
-        formatter = JSONFormatter()
-        record = logging.LogRecord(
+    @pytest.fixture(scope="module")
+    def formatter(self):
+        """Formatter shared by the format tests."""
+        return JSONFormatter()
+
+    @pytest.fixture(scope="module")
+    def base_record(self):
+        """INFO record shared by the format tests; copy before changing it."""
+        return logging.LogRecord(
             name="test",
             level=logging.INFO,
             pathname="test.py",
@@ -31,8 +69,12 @@ class TestJSONFormatter:
             args=(),
             exc_info=None,
         )
+
+    def test_format_basic_message(self, formatter, base_record):
+        """Test formatting basic log message."""
+        record = copy.copy(base_record)
         result = formatter.format(record)
-        data = json.loads(result)
+        data = json_loads(result)
 
         assert data["level"] == "INFO"
         assert data["component"] == "test"
@@ -40,65 +82,40 @@ class TestJSONFormatter:
         assert "timestamp" in data
         assert data["timestamp"].endswith("Z")
 
-    def test_format_with_context(self):
+    def test_format_with_context(self, formatter, base_record):
         """Test formatting message with context."""
-        formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = copy.copy(base_record)
         record.context = {"key": "value", "number": 42}
         result = formatter.format(record)
-        data = json.loads(result)
+        data = json_loads(result)
 
         assert "context" in data
         assert data["context"]["key"] == "value"
         assert data["context"]["number"] == 42
 
-    def test_format_with_correlation_id(self):
+    def test_format_with_correlation_id(self, formatter, base_record):
         """Test formatting message with correlation ID."""
-        formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = copy.copy(base_record)
         record.correlation_id = "uuid-1234-5678"
         result = formatter.format(record)
-        data = json.loads(result)
+        data = json_loads(result)
 
         assert data["correlation_id"] == "uuid-1234-5678"
 
-    def test_format_with_exception(self):
+    def test_format_with_exception(self, formatter, base_record):
         """Test formatting message with exception info."""
-        formatter = JSONFormatter()
         try:
             raise ValueError("Test error")
         except ValueError:
-            import sys
-
             exc_info = sys.exc_info()
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.ERROR,
-            pathname="test.py",
-            lineno=1,
-            msg="Error occurred",
-            args=(),
-            exc_info=exc_info,
-        )
+        record = copy.copy(base_record)
+        record.levelno = logging.ERROR
+        record.levelname = "ERROR"
+        record.msg = "Error occurred"
+        record.exc_info = exc_info
         result = formatter.format(record)
-        data = json.loads(result)
+        data = json_loads(result)
 
         assert "exception" in data
         assert "ValueError" in data["exception"]
@@ -149,19 +166,51 @@ class TestSetupLogging:
         handler = logger.handlers[0]
         assert isinstance(handler.formatter, JSONFormatter)
 
-    def test_setup_with_file_output(self):
+    def test_json_handlers_share_formatter(self, tmp_path):
+        """Test JSON console and file handlers reuse a single formatter."""
+        setup_logging(log_format="json", log_file=str(tmp_path / "test.log"))
+        console_handler, file_handler = logging.getLogger("data_quality").handlers
+        assert isinstance(console_handler.formatter, JSONFormatter)
+        assert file_handler.formatter is console_handler.formatter
+
+    def test_setup_with_file_output(self, tmp_path):
         """Test setup with file output."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".log") as f:
-            log_file = f.name
+        log_file = tmp_path / "test.log"
 
-        try:
-            setup_logging(log_file=log_file)
-            logger = logging.getLogger("data_quality")
-            # Should have console and file handlers
-            assert len(logger.handlers) == 2
-            assert os.path.exists(log_file)
-        finally:
-            os.unlink(log_file)
+        setup_logging(log_file=str(log_file))
+        logger = logging.getLogger("data_quality")
+        # Should have console and file handlers
+        assert len(logger.handlers) == 2
+        file_handler = logger.handlers[1]
+        assert isinstance(file_handler, logging.FileHandler)
+        assert file_handler.baseFilename == str(log_file)
+        # The file is only opened once a record is written
+        assert not log_file.exists()
+        logger.info("first record")
+        assert log_file.exists()
+
+    def test_setup_with_buffered_file_output(self, tmp_path):
+        """Test opt-in buffering of file output."""
+        log_file = tmp_path / "test.log"
+
+        setup_logging(log_file=str(log_file), buffer_capacity=10)
+        logger = logging.getLogger("data_quality")
+        buffered_handler = logger.handlers[1]
+        assert isinstance(buffered_handler, logging.handlers.MemoryHandler)
+        file_handler = buffered_handler.target
+        assert isinstance(file_handler, logging.FileHandler)
+
+        # INFO records wait in the buffer; WARNING flushes them
+        logger.info("buffered record")
+        assert not log_file.exists()
+        logger.warning("flushing record")
+        assert len(log_file.read_text().splitlines()) == 2
+
+        # Reconfiguring closes the buffered handler and its file handler
+        logger.info("pending record")
+        setup_logging()
+        assert file_handler.stream is None
+        assert len(log_file.read_text().splitlines()) == 3
 
     def test_clears_existing_handlers(self):
         """Test that setup clears existing handlers."""
@@ -198,12 +247,12 @@ class TestGetLogger:
         assert logger.extra == {}
 
 
+@pytest.mark.usefixtures("_debug_logging")
 class TestLogWithContext:
     """Tests for log_with_context function."""
 
     def test_log_info_with_context(self):
         """Test logging info with context."""
-        setup_logging(level="DEBUG")
         logger = logging.getLogger("data_quality.test")
 
         # This should not raise
@@ -211,14 +260,12 @@ class TestLogWithContext:
 
     def test_log_error_with_context(self):
         """Test logging error with context."""
-        setup_logging(level="DEBUG")
         logger = logging.getLogger("data_quality.test")
 
         log_with_context(logger, "error", "Error message", {"error_code": 500})
 
     def test_log_without_context(self):
         """Test logging without context."""
-        setup_logging(level="DEBUG")
         logger = logging.getLogger("data_quality.test")
 
         log_with_context(logger, "warning", "Warning message", None)
@@ -227,28 +274,22 @@ class TestLogWithContext:
 class TestLoggingIntegration:
     """Integration tests for logging."""
 
-    def test_full_logging_flow(self):
+    def test_full_logging_flow(self, tmp_path):
         """Test complete logging flow."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".log") as f:
-            log_file = f.name
-
-        try:
-            setup_logging(level="DEBUG", log_format="json", log_file=log_file)
+        log_file = tmp_path / "test.log"
 
-            logger = get_logger("integration_test", {"test": True})
-            logger.info("Test message")
-            logger.error("Error message")
+        setup_logging(level="DEBUG", log_format="json", log_file=str(log_file))
 
-            # Read and verify log file
-            with open(log_file, "r") as f:
-                lines = f.readlines()
-                assert len(lines) >= 2
+        logger = get_logger("integration_test", {"test": True})
+        logger.info("Test message")
+        logger.error("Error message")
 
-                for line in lines:
-                    data = json.loads(line)
-                    assert "timestamp" in data
-                    assert "level" in data
-                    assert "message" in data
+        # Read and verify log file
+        lines = log_file.read_bytes().splitlines()
+        assert len(lines) >= 2
 
-        finally:
-            os.unlink(log_file)
+        for line in lines:
+            data = json_loads(line)
+            assert "timestamp" in data
+            assert "level" in data
+            assert "message" in data
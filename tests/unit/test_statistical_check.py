@@ -7,65 +7,43 @@ import pytest
 from data_quality.checks.statistical import StatisticalCheck
 from data_quality.utils.constants import CheckStatus
 
-# Import shared fixtures
-from tests.fixtures.test_fixtures import (
-    basic_df,
-    edge_case_configs,
-    extreme_values_df,
-    messy_data_df,
-    multi_date_df,
-    statistical_config,
+_BASIC_MEASURES = frozenset({"mean", "std", "median"})
+_ALL_MEASURES = frozenset(
+    {"mean", "median", "std", "min", "max", "count", "skew", "kurtosis"}
 )
 
 
 class TestStatisticalCheck:
     """Tests for the StatisticalCheck class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_df(self):
         """Create sample DataFrame with numeric data."""
         return pd.DataFrame(
             {
-                "id": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-                "date": pd.to_datetime(
-                    [
-                        "2025-01-01",
-                        "2025-01-01",
-                        "2025-01-01",
-                        "2025-01-01",
-                        "2025-01-01",
-                        "2025-01-02",
-                        "2025-01-02",
-                        "2025-01-02",
-                        "2025-01-02",
-                        "2025-01-02",
-                    ]
+                "id": np.arange(1, 11),
+                "date": np.repeat(
+                    np.array(["2025-01-01", "2025-01-02"], dtype="datetime64[ns]"), 5
                 ),
                 "value": [10.0, 20.0, 30.0, 40.0, 50.0, 15.0, 25.0, 35.0, 45.0, 55.0],
                 "score": [1.0, 2.0, 3.0, 4.0, 5.0, 1.5, 2.5, 3.5, 4.5, 5.5],
             }
         )
 
-    def test_statistical_check_basic_measures(self, sample_df):
-        """Test basic statistical measures calculation."""
-        config = {"value": {"measures": ["mean", "std", "median"], "thresholds": {}}}
-
-        check = StatisticalCheck(
-            df=sample_df, date_col="date", id_col="id", check_config=config
+    @pytest.fixture(scope="module")
+    def nulls_df(self):
+        """Create a single-date DataFrame with null values."""
+        return pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4, 5],
+                "date": np.full(5, np.datetime64("2025-01-01", "ns")),
+                "value": [10.0, 20.0, np.nan, 40.0, np.nan],
+            }
         )
 
-        results = check.run()
-
-        assert len(results) == 3  # mean, std, median
-        assert all(results["check_type"] == "statistical")
-        assert all(results["column"] == "value")
-
-        # Check that we get expected measures
-        measures = set(results["measure"])
-        assert measures == {"mean", "std", "median"}
-
-    def test_statistical_check_all_measures(self, sample_df):
-        """Test all available statistical measures."""
+    @pytest.fixture(scope="module")
+    def all_measures_result(self, sample_df):
+        """Run every available measure on the value column once per module."""
         config = {
             "value": {
                 "measures": [
@@ -86,43 +64,11 @@ class TestStatisticalCheck:
             df=sample_df, date_col="date", id_col="id", check_config=config
         )
 
-        results = check.run()
+        return check.run()
 
-        assert len(results) == 8
-        measures = set(results["measure"])
-        expected = {"mean", "median", "std", "min", "max", "count", "skew", "kurtosis"}
-        assert measures == expected
-
-    def test_statistical_check_with_thresholds_pass(self, sample_df):
-        """Test statistical check passing thresholds."""
-        config = {
-            "value": {
-                "measures": ["mean"],
-                "thresholds": {
-                    "mean": {"absolute_critical": 100}  # Mean ~32.5, should pass
-                },
-            }
-        }
-
-        check = StatisticalCheck(
-            df=sample_df, date_col="date", id_col="id", check_config=config
-        )
-
-        results = check.run()
-
-        assert len(results) == 1
-        assert results.iloc[0]["status"] == CheckStatus.PASS
-
-    def test_statistical_check_with_thresholds_fail(self, sample_df):
-        """Test statistical check failing thresholds."""
-        config = {
-            "value": {
-                "measures": ["mean"],
-                "thresholds": {
-                    "mean": {"absolute_critical": 10}  # Mean ~32.5, should fail
-                },
-            }
-        }
+    def test_statistical_check_basic_measures(self, sample_df):
+        """Test basic statistical measures calculation."""
+        config = {"value": {"measures": ["mean", "std", "median"], "thresholds": {}}}
 
         check = StatisticalCheck(
             df=sample_df, date_col="date", id_col="id", check_config=config
@@ -130,40 +76,23 @@ class TestStatisticalCheck:
 
         results = check.run()
 
-        assert len(results) == 1
-        assert results.iloc[0]["status"] == CheckStatus.FAIL
-        assert results.iloc[0]["severity"] == "CRITICAL"
+        assert len(results) == 3  # mean, std, median
+        assert all(results["check_type"] == "statistical")
+        assert all(results["column"] == "value")
 
-    def test_statistical_check_with_range_thresholds(self, sample_df):
-        """Test statistical check with range thresholds (list format)."""
-        config = {
-            "value": {
-                "measures": ["mean"],
-                "thresholds": {
-                    "mean": {"absolute_critical": [20, 40]}  # Mean ~32.5, should pass
-                },
-            }
-        }
+        # Check that we get expected measures
+        assert set(results["measure"].unique()) == _BASIC_MEASURES
 
-        check = StatisticalCheck(
-            df=sample_df, date_col="date", id_col="id", check_config=config
-        )
+    def test_statistical_check_all_measures(self, all_measures_result):
+        """Test all available statistical measures."""
+        results = all_measures_result
 
-        results = check.run()
+        assert len(results) == 8
+        assert set(results["measure"].unique()) == _ALL_MEASURES
 
-        assert len(results) == 1
-        assert results.iloc[0]["status"] == CheckStatus.PASS
-
-    def test_statistical_check_with_range_thresholds_fail(self, sample_df):
-        """Test statistical check failing range thresholds."""
-        config = {
-            "value": {
-                "measures": ["mean"],
-                "thresholds": {
-                    "mean": {"absolute_critical": [50, 60]}  # Mean ~32.5, should fail
-                },
-            }
-        }
+    def test_statistical_check_requested_measures_only(self, sample_df):
+        """Test only the configured measures are calculated and reported."""
+        config = {"value": {"measures": ["median"], "thresholds": {}}}
 
         check = StatisticalCheck(
             df=sample_df, date_col="date", id_col="id", check_config=config
@@ -171,12 +100,55 @@ class TestStatisticalCheck:
 
         results = check.run()
 
-        assert len(results) == 1
-        assert results.iloc[0]["status"] == CheckStatus.FAIL
-
-    def test_statistical_check_missing_column(self, sample_df):
-        """Test statistical check with missing column."""
-        config = {"missing_column": {"measures": ["mean"], "thresholds": {}}}
+        assert results["measure"].tolist() == ["median"]
+        assert results["metric_value"].iat[0] == 32.5
+
+    @pytest.mark.parametrize(
+        "column,measures,thresholds,expected",
+        [
+            # Mean ~32.5 against scalar and range thresholds
+            (
+                "value",
+                ["mean"],
+                {"mean": {"absolute_critical": 100}},
+                {"status": CheckStatus.PASS},
+            ),
+            (
+                "value",
+                ["mean"],
+                {"mean": {"absolute_critical": 10}},
+                {"status": CheckStatus.FAIL, "severity": "CRITICAL"},
+            ),
+            (
+                "value",
+                ["mean"],
+                {"mean": {"absolute_critical": [20, 40]}},
+                {"status": CheckStatus.PASS},
+            ),
+            (
+                "value",
+                ["mean"],
+                {"mean": {"absolute_critical": [50, 60]}},
+                {"status": CheckStatus.FAIL},
+            ),
+            ("missing_column", ["mean"], {}, {"status": CheckStatus.ERROR}),
+            # unknown_measure is skipped, leaving only the result for 'mean'
+            ("value", ["mean", "unknown_measure"], {}, {"measure": "mean"}),
+        ],
+        ids=[
+            "threshold_pass",
+            "threshold_fail",
+            "range_pass",
+            "range_fail",
+            "missing_column",
+            "unknown_measure",
+        ],
+    )
+    def test_statistical_check_single_result(
+        self, sample_df, column, measures, thresholds, expected
+    ):
+        """Test threshold evaluation and config errors yielding one result."""
+        config = {column: {"measures": measures, "thresholds": thresholds}}
 
         check = StatisticalCheck(
             df=sample_df, date_col="date", id_col="id", check_config=config
@@ -185,7 +157,8 @@ class TestStatisticalCheck:
         results = check.run()
 
         assert len(results) == 1
-        assert results.iloc[0]["status"] == CheckStatus.ERROR
+        for field, value in expected.items():
+            assert results[field].iat[0] == value
 
     def test_statistical_check_with_filter(self, sample_df):
         """Test statistical check with filter condition."""
@@ -204,7 +177,7 @@ class TestStatisticalCheck:
         results = check.run()
 
         assert len(results) == 1
-        assert results.iloc[0]["metric_value"] == 5  # Only 5 records for 2025-01-01
+        assert results["metric_value"].iat[0] == 5  # Only 5 records for 2025-01-01
 
     def test_statistical_check_empty_after_filter(self, sample_df):
         """Test statistical check with empty data after filtering."""
@@ -236,41 +209,19 @@ class TestStatisticalCheck:
 
         assert len(results) == 0  # No results for disabled column
 
-    def test_statistical_check_unknown_measure(self, sample_df):
-        """Test statistical check with unknown measure."""
-        config = {"value": {"measures": ["mean", "unknown_measure"], "thresholds": {}}}
-
-        check = StatisticalCheck(
-            df=sample_df, date_col="date", id_col="id", check_config=config
-        )
-
-        results = check.run()
-
-        # Should only get result for 'mean', unknown_measure is skipped
-        assert len(results) == 1
-        assert results.iloc[0]["measure"] == "mean"
-
-    def test_statistical_check_with_nulls(self):
+    def test_statistical_check_with_nulls(self, nulls_df):
         """Test statistical check with null values."""
-        df = pd.DataFrame(
-            {
-                "id": [1, 2, 3, 4, 5],
-                "date": pd.to_datetime(["2025-01-01"] * 5),
-                "value": [10.0, 20.0, np.nan, 40.0, np.nan],
-            }
-        )
-
         config = {"value": {"measures": ["count", "mean"], "thresholds": {}}}
 
         check = StatisticalCheck(
-            df=df, date_col="date", id_col="id", check_config=config
+            df=nulls_df, date_col="date", id_col="id", check_config=config
         )
 
         results = check.run()
 
         assert len(results) == 2
-        count_result = results[results["measure"] == "count"].iloc[0]
-        assert count_result["metric_value"] == 3  # Only non-null values counted
+        count = results.loc[results["measure"].values == "count", "metric_value"].iat[0]
+        assert count == 3  # Only non-null values counted
 
     def test_statistical_check_with_shared_fixtures(
         self, extreme_values_df, statistical_config
@@ -291,10 +242,12 @@ class TestStatisticalCheck:
         if len(results) > 0:
             # Check if we have measure column (normal results) or error results
             if "measure" in results.columns:
-                mean_result = results[results["measure"] == "mean"]
-                if len(mean_result) > 0:
-                    assert not pd.isna(mean_result.iloc[0]["metric_value"])
-                    assert not np.isinf(mean_result.iloc[0]["metric_value"])
+                mean_values = results.loc[
+                    results["measure"].values == "mean", "metric_value"
+                ]
+                if len(mean_values) > 0:
+                    assert not pd.isna(mean_values.iat[0])
+                    assert not np.isinf(mean_values.iat[0])
             else:
                 # Error results - just verify they exist
                 assert "status" in results.columns
@@ -337,9 +290,7 @@ class TestStatisticalCheck:
         assert len(results) == 4
 
         # Check that infinite values are handled
-        for _, result in results.iterrows():
-            # Results should be finite numbers or handled gracefully
-            if not pd.isna(result["metric_value"]):
-                assert np.isfinite(result["metric_value"]) or result[
-                    "metric_value"
-                ] in [np.inf, -np.inf]
+        # Results should be finite numbers or handled gracefully
+        metric_values = results["metric_value"].to_numpy(dtype=float)
+        present = ~np.isnan(metric_values)
+        assert (np.isfinite(metric_values) | np.isinf(metric_values))[present].all()